@@ -1,22 +1,91 @@
 import json
 import re
 import os
-from typing import List, Dict, Any
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Tuple, Iterable, Iterator, BinaryIO
 import fitz  # PyMuPDF (imported as fitz)
 from PIL import Image
 import io
 
+try:
+    import orjson  # Optional: much faster JSON serialization
+except ImportError:
+    orjson = None
+
+# Precompiled patterns used while parsing question text. _TOKEN_RE matches a
+# whole line that starts a question, lists an option or gives the answer.
+_TOKEN_RE = re.compile(
+    r'^[^\S\n]*(?:'
+    r'(?P<number>\d+)\.[^\S\n]*(?P<question>.*)'
+    r'|\[(?P<option>[ABCD])\][^\S\n]*(?P<option_text>.*)'
+    r'|Ans(?:.*?\[(?P<answer>[ABCD])\])?.*)',
+    re.MULTILINE,
+)
+
+# Embedded image formats that are written out without re-encoding
+_PASSTHROUGH_IMAGE_EXTS = ("png", "jpeg")
+
+@dataclass
+class Question:
+    """A question parsed from one page of the PDF."""
+    
+    # Declared by hand (not dataclass(slots=True)) to support Python < 3.10
+    __slots__ = ("question_number", "question", "options", "answer", "page", "images")
+    
+    question_number: int
+    question: str
+    options: List[str]
+    answer: str
+    page: int
+    images: str
+    
+    @property
+    def option_images(self) -> List[str]:
+        """Names of the per-option image files, built from the page and option count."""
+        return [f"page{self.page}_option{j}.png" for j in range(len(self.options))]
+    
+    def __getitem__(self, key: str) -> Any:
+        """Dict-style field access, as used by code written for question dicts."""
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style field access with a default, like dict.get."""
+        return getattr(self, key, default)
+
+
 class PDFContentAnalyzer:
     """
     A comprehensive PDF content analyzer that extracts text, images, and generates
     structured question data for educational content analysis.
     """
     
-    def __init__(self, pdf_path: str):
+    # prefetch_pages only starts worker processes when each worker gets at
+    # least this many pages. Serial extraction costs about 4-5 ms per page and
+    # every extra worker about 17 ms to start, so smaller runs are faster
+    # in-process.
+    MIN_PAGES_PER_WORKER = 32
+    
+    # When extract_all_content spools pages to a file, pages are extracted in
+    # batches of at least this many, so only one batch is held in memory
+    SPOOL_BATCH_PAGES = 256
+    
+    def __init__(self, pdf_path: str, max_workers: Optional[int] = None,
+                 output_dir: str = "extracted_content"):
         self.pdf_path = pdf_path
+        self.max_workers = max_workers or os.cpu_count() or 1
         self.doc = fitz.open(pdf_path)
-        self.output_dir = "extracted_content"
+        self.output_dir = output_dir
         self.images_dir = os.path.join(self.output_dir, "images")
+        # Per-page extraction results, keyed by page number
+        self._text_cache: Dict[int, str] = {}
+        self._image_cache: Dict[int, List[str]] = {}
+        # Saved image path per image xref, None for images that were skipped
+        self._xref_cache: Dict[int, Optional[str]] = {}
         self.ensure_directories()
     
     def ensure_directories(self):
@@ -26,112 +95,212 @@ class PDFContentAnalyzer:
     
     def extract_text_from_page(self, page_num: int) -> str:
         """Extract text content from a specific page."""
-        page = self.doc[page_num]
-        return page.get_text()
+        if page_num not in self._text_cache:
+            self._text_cache[page_num] = self._extract_text(self.doc[page_num])
+        return self._text_cache[page_num]
     
     def extract_images_from_page(self, page_num: int) -> List[str]:
         """Extract images from a specific page and save them."""
-        page = self.doc[page_num]
+        if page_num not in self._image_cache:
+            self._image_cache[page_num] = self._extract_images(self.doc[page_num])
+        return self._image_cache[page_num]
+    
+    def extract_page(self, page_num: int) -> Tuple[str, List[str]]:
+        """Extract the text and images of a page, loading the page only once."""
+        if page_num not in self._text_cache or page_num not in self._image_cache:
+            page = self.doc[page_num]
+            if page_num not in self._text_cache:
+                self._text_cache[page_num] = self._extract_text(page)
+            if page_num not in self._image_cache:
+                self._image_cache[page_num] = self._extract_images(page)
+        return self._text_cache[page_num], self._image_cache[page_num]
+    
+    def _extract_text(self, page: "fitz.Page") -> str:
+        """Extract text content from a loaded page."""
+        return page.get_text()
+    
+    def _extract_images(self, page: "fitz.Page") -> List[str]:
+        """Extract images from a loaded page and save them."""
         image_list = page.get_images()
         image_paths = []
+        img_prefix = self.images_dir + os.sep  # Avoids os.path.join per image
         
-        for img_index, img in enumerate(image_list):
+        for img in image_list:
             # Get image data
             xref = img[0]
-            pix = fitz.Pixmap(self.doc, xref)
             
-            # Convert to PIL Image if needed
-            if pix.n - pix.alpha < 4:  # GRAY or RGB
-                img_data = pix.tobytes("png")
-                image_filename = f"page{page_num + 1}_image{img_index + 1}.png"
-                image_path = os.path.join(self.images_dir, image_filename)
+            # Images shared between pages are only saved the first time
+            if xref in self._xref_cache:
+                if self._xref_cache[xref] is not None:
+                    image_paths.append(self._xref_cache[xref])
+                continue
+            
+            image_path = None
+            info = self.doc.extract_image(xref)
+            # Files are named by xref, so worker processes may save the same image.
+            # Each writes a private temporary file and renames it into place.
+            tmp_path = f"{img_prefix}img_xref{xref}.{os.getpid()}.tmp"
+            
+            # PNG and JPEG streams are saved as stored, without decoding
+            if info and info["ext"] in _PASSTHROUGH_IMAGE_EXTS and info["colorspace"] < 4:
+                image_path = f"{img_prefix}img_xref{xref}.{info['ext']}"
                 
-                with open(image_path, "wb") as img_file:
-                    img_file.write(img_data)
+                with open(tmp_path, "wb") as img_file:
+                    img_file.write(info["image"])
+                os.replace(tmp_path, image_path)
+            
+            # Other formats are decoded and re-encoded as PNG
+            else:
+                pix = fitz.Pixmap(self.doc, xref)
                 
-                image_paths.append(image_path)
+                # Convert to PIL Image if needed
+                if pix.n - pix.alpha < 4:  # GRAY or RGB
+                    image_path = f"{img_prefix}img_xref{xref}.png"
+                    # MuPDF writes the PNG directly, without an intermediate bytes object
+                    pix.save(tmp_path, output="png")
+                    os.replace(tmp_path, image_path)
+                
+                pix = None  # Free memory
             
-            pix = None  # Free memory
+            # Skipped images are cached as None so they are not decoded again
+            self._xref_cache[xref] = image_path
+            if image_path is not None:
+                image_paths.append(image_path)
         
         return image_paths
     
-    def parse_question_from_text(self, text: str, page_num: int) -> List[Dict[str, Any]]:
-        """Parse questions from extracted text."""
-        questions = []
+    def parse_question_from_text(self, text: str, page_num: int) -> List[Question]:
+        """
+        Parse questions from extracted text.
         
-        # Split text into lines and process
-        lines = text.strip().split('\n')
+        Option image names are not built here; iter_structured_questions
+        derives them from each question's page and option count when writing.
+        """
+        questions = []
+        page = page_num + 1
         current_question = None
-        question_text = ""
+        question_parts: List[str] = []
         options = []
         answer = ""
-        
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-            
-            # Skip empty lines
-            if not line:
-                i += 1
-                continue
+        position = 0
+        
+        # Scan the whole page once; anything between two tokens is question text
+        for match in _TOKEN_RE.finditer(text):
+            if current_question is not None:
+                gap = text[position:match.start()]
+                # Most gaps are only blank lines, which add nothing
+                if not gap.isspace():
+                    question_parts.extend(self._split_lines(gap))
+            position = match.end()
+            number, question_line, option, option_text, answer_letter = match.groups()
             
-            # Check if line starts with a number (indicating a new question)
-            if re.match(r'^\d+\.', line):
+            # Line starts with a number (indicating a new question)
+            if number is not None:
                 # Save previous question if exists
+                # (the options list is handed over, not copied)
+                question_text = " ".join(question_parts).strip()
                 if current_question is not None and question_text:
-                    questions.append({
-                        "question_number": current_question,
-                        "question": question_text.strip(),
-                        "options": options.copy(),
-                        "answer": answer,
-                        "page": page_num + 1,
-                        "images": f"page{page_num + 1}_question{current_question}.png",
-                        "option_images": [f"page{page_num + 1}_option{j}.png" for j in range(len(options))]
-                    })
+                    questions.append(Question(
+                        question_number=current_question,
+                        question=question_text,
+                        options=options,
+                        answer=answer,
+                        page=page,
+                        images=f"page{page}_question{current_question}.png"
+                    ))
                 
                 # Start new question
-                current_question = int(line.split('.')[0])
-                question_text = line[line.find('.') + 1:].strip()
+                current_question = int(number)
+                question_parts = [question_line.strip()]
                 options = []
                 answer = ""
             
-            # Check for options [A], [B], [C], [D]
-            elif re.match(r'^\[([ABCD])\]', line):
-                option_match = re.match(r'^\[([ABCD])\]\s*(.*)', line)
-                if option_match:
-                    option_letter = option_match.group(1)
-                    option_text = option_match.group(2).strip()
-                    options.append(f"[{option_letter}] {option_text}")
+            # Options [A], [B], [C], [D]
+            elif option is not None:
+                options.append(f"[{option}] {option_text.strip()}")
             
-            # Check for answer
-            elif line.startswith('Ans'):
-                answer_match = re.search(r'\[([ABCD])\]', line)
-                if answer_match:
-                    answer = answer_match.group(1)
-            
-            # Otherwise, it's part of the question text
-            else:
-                if current_question is not None:
-                    question_text += " " + line
-            
-            i += 1
+            # Answer line, with the first [A]-[D] it contains
+            elif answer_letter is not None:
+                answer = answer_letter
         
         # Don't forget the last question
+        if current_question is not None:
+            question_parts.extend(self._split_lines(text[position:]))
+        
+        question_text = " ".join(question_parts).strip()
         if current_question is not None and question_text:
-            questions.append({
-                "question_number": current_question,
-                "question": question_text.strip(),
-                "options": options.copy(),
-                "answer": answer,
-                "page": page_num + 1,
-                "images": f"page{page_num + 1}_question{current_question}.png",
-                "option_images": [f"page{page_num + 1}_option{j}.png" for j in range(len(options))]
-            })
+            questions.append(Question(
+                question_number=current_question,
+                question=question_text,
+                options=options,
+                answer=answer,
+                page=page,
+                images=f"page{page}_question{current_question}.png"
+            ))
         
         return questions
     
-    def extract_all_content(self) -> Dict[str, Any]:
-        """Extract all content from the PDF."""
+    @staticmethod
+    def _split_lines(chunk: str) -> List[str]:
+        """Return the stripped, non-empty lines of a text chunk."""
+        return [line for line in map(str.strip, chunk.split('\n')) if line]
+    
+    def _process_page(self, page_num: int) -> Tuple[Dict[str, Any], List[Question]]:
+        """Extract text, images and questions from a single page."""
+        # Extract text and images
+        page_text, page_images = self.extract_page(page_num)
+        
+        # Parse questions from text
+        page_questions = self.parse_question_from_text(page_text, page_num)
+        
+        # Store page content
+        page_content = {
+            "page_number": page_num + 1,
+            "text": page_text,
+            "images": page_images,
+            "questions_found": len(page_questions)
+        }
+        
+        return page_content, page_questions
+    
+    def prefetch_pages(self, page_nums: Optional[Iterable[int]] = None):
+        """
+        Extract text and images of uncached pages in parallel.
+        
+        Defaults to every page of the document.
+        
+        PyMuPDF documents must not be shared between threads, so each worker
+        process opens its own copy of the PDF. Results are stored in the
+        per-page caches used by extract_text_from_page and
+        extract_images_from_page.
+        """
+        if page_nums is None:
+            page_nums = range(len(self.doc))
+        pending = [page_num for page_num in page_nums
+                   if page_num not in self._text_cache or page_num not in self._image_cache]
+        workers = min(self.max_workers, len(pending) // self.MIN_PAGES_PER_WORKER)
+        if workers < 2:
+            return
+        
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(self.pdf_path, self.output_dir, self.images_dir)) as executor:
+            # Give each worker a contiguous run of pages so its xref cache can
+            # skip images shared between neighbouring pages
+            chunksize = -(-len(pending) // workers)
+            results = executor.map(_extract_page, pending, chunksize=chunksize)
+            for page_num, (page_text, page_images) in zip(pending, results):
+                self._text_cache[page_num] = page_text
+                self._image_cache[page_num] = page_images
+    
+    def extract_all_content(self, pages_file: Optional[BinaryIO] = None) -> Dict[str, Any]:
+        """
+        Extract all content from the PDF.
+        
+        If pages_file is given, each page record is written to it as a JSON
+        line as soon as it is built instead of being kept in "pages". Pages
+        are then extracted in batches and dropped from the per-page caches
+        once written, so memory use does not grow with the page count.
+        """
         all_content = {
             "pdf_info": {
                 "filename": os.path.basename(self.pdf_path),
@@ -142,95 +311,172 @@ class PDFContentAnalyzer:
             "questions": []
         }
         
-        total_images = 0
+        image_files = set()  # Pages may share images, so count files once
         total_questions = 0
         
-        for page_num in range(len(self.doc)):
-            print(f"Processing page {page_num + 1}...")
-            
-            # Extract text
-            page_text = self.extract_text_from_page(page_num)
-            
-            # Extract images
-            page_images = self.extract_images_from_page(page_num)
-            total_images += len(page_images)
-            
-            # Parse questions from text
-            page_questions = self.parse_question_from_text(page_text, page_num)
-            total_questions += len(page_questions)
+        total_pages = len(self.doc)
+        if pages_file is not None:
+            batch_size = max(self.SPOOL_BATCH_PAGES, self.max_workers * self.MIN_PAGES_PER_WORKER)
+        else:
+            batch_size = max(total_pages, 1)
+        
+        for batch_start in range(0, total_pages, batch_size):
+            batch = range(batch_start, min(batch_start + batch_size, total_pages))
             
-            # Store page content
-            page_content = {
-                "page_number": page_num + 1,
-                "text": page_text,
-                "images": page_images,
-                "questions_found": len(page_questions)
-            }
+            # Extract uncached pages in worker processes first
+            self.prefetch_pages(batch)
             
-            all_content["pages"].append(page_content)
-            all_content["questions"].extend(page_questions)
+            for page_num in batch:
+                print(f"Processing page {page_num + 1}...")
+                
+                page_content, page_questions = self._process_page(page_num)
+                image_files.update(page_content["images"])
+                total_questions += len(page_questions)
+                
+                if pages_file is not None:
+                    pages_file.write(self._encode_json_line(page_content))
+                    # The page is on disk now; keep only one batch in memory
+                    self._text_cache.pop(page_num, None)
+                    self._image_cache.pop(page_num, None)
+                else:
+                    all_content["pages"].append(page_content)
+                all_content["questions"].extend(page_questions)
         
         # Update summary
         all_content["pdf_info"]["extraction_summary"] = {
-            "total_images_extracted": total_images,
+            "total_images_extracted": len(image_files),
             "total_questions_found": total_questions,
             "pages_processed": len(self.doc)
         }
         
         return all_content
     
-    def generate_structured_json(self) -> List[Dict[str, Any]]:
-        """Generate the structured JSON as specified in the assignment."""
-        content = self.extract_all_content()
-        structured_questions = []
-        
-        for question in content["questions"]:
+    def iter_structured_questions(self, questions: List[Question]) -> Iterator[Dict[str, Any]]:
+        """Yield each question in the structured form, one at a time."""
+        for question in questions:
             # Create the structure as requested in the assignment
-            structured_question = {
-                "question_number": question.get("question_number"),
-                "question": question.get("question", ""),
-                "options": question.get("options", []),
-                "answer": question.get("answer", ""),
-                "page": question.get("page", 1),
-                "images": question.get("images", ""),
-                "option_images": question.get("option_images", [])
+            yield {
+                "question_number": question.question_number,
+                "question": question.question,
+                "options": question.options,
+                "answer": question.answer,
+                "page": question.page,
+                "images": question.images,
+                "option_images": question.option_images
             }
-            structured_questions.append(structured_question)
-        
-        return structured_questions
     
-    def save_results(self):
-        """Save all results to files."""
-        # Generate structured content
-        structured_content = self.generate_structured_json()
-        
-        # Save structured JSON (as requested in assignment)
-        structured_json_path = os.path.join(self.output_dir, "structured_questions.json")
-        with open(structured_json_path, 'w', encoding='utf-8') as f:
-            json.dump(structured_content, f, indent=2, ensure_ascii=False)
-        
-        # Also save complete extraction data
-        complete_content = self.extract_all_content()
-        complete_json_path = os.path.join(self.output_dir, "complete_extraction.json")
-        with open(complete_json_path, 'w', encoding='utf-8') as f:
-            json.dump(complete_content, f, indent=2, ensure_ascii=False)
+    def generate_structured_json(self, content: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Generate the structured JSON as specified in the assignment.
+        
+        Pass the result of extract_all_content() as content to avoid
+        extracting the PDF again.
+        """
+        if content is None:
+            content = self.extract_all_content()
+        return list(self.iter_structured_questions(content["questions"]))
+    
+    @staticmethod
+    def _encode_json(data: Any, level: int = 0) -> bytes:
+        """Encode data as 2-space indented JSON, nested `level` steps deep."""
+        if orjson is not None:
+            encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            encoded = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+        
+        # Newlines inside JSON strings are escaped, so every raw newline is layout
+        if level:
+            encoded = encoded.replace(b"\n", b"\n" + b"  " * level)
+        return encoded
+    
+    @staticmethod
+    def _encode_json_line(data: Any) -> bytes:
+        """Encode data as one compact line of JSON Lines."""
+        if orjson is not None:
+            return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+        return json.dumps(data, ensure_ascii=False).encode('utf-8') + b"\n"
+    
+    @staticmethod
+    def _iter_json_lines(f: BinaryIO) -> Iterator[Any]:
+        """Decode the records of a JSON Lines file one line at a time."""
+        loads = orjson.loads if orjson is not None else json.loads
+        for line in f:
+            yield loads(line)
+    
+    def _write_json_array(self, f: BinaryIO, items: Iterable[Any], level: int = 0):
+        """Write items to f as a JSON array, encoding one item at a time."""
+        indent = b"\n" + b"  " * (level + 1)
+        separator = indent
+        f.write(b"[")
+        for item in items:
+            f.write(separator)
+            f.write(self._encode_json(item, level + 1))
+            separator = b"," + indent
+        f.write(b"]" if separator is indent else b"\n" + b"  " * level + b"]")
+    
+    def save_results(self) -> List[Question]:
+        """
+        Save all results to files and return the parsed questions.
+        
+        Questions are converted to the structured form and encoded one at a
+        time while writing, so no full JSON document or structured list is
+        built in memory, and page records are spooled to a temporary JSON
+        Lines file rather than kept in memory. The returned Question records
+        support dict-style access to every structured field.
+        """
+        with tempfile.TemporaryFile() as pages_file:
+            content = self.extract_all_content(pages_file=pages_file)
+            questions = content["questions"]
+            
+            # Save structured JSON (as requested in assignment)
+            structured_json_path = os.path.join(self.output_dir, "structured_questions.json")
+            with open(structured_json_path, 'wb') as f:
+                self._write_json_array(f, self.iter_structured_questions(questions))
+            
+            # Also save complete extraction data, with questions in the structured form
+            complete_json_path = os.path.join(self.output_dir, "complete_extraction.json")
+            pages_file.seek(0)
+            with open(complete_json_path, 'wb') as f:
+                f.write(b'{\n  "pdf_info": ')
+                f.write(self._encode_json(content["pdf_info"], 1))
+                f.write(b',\n  "pages": ')
+                self._write_json_array(f, self._iter_json_lines(pages_file), 1)
+                f.write(b',\n  "questions": ')
+                self._write_json_array(f, self.iter_structured_questions(questions), 1)
+                f.write(b'\n}')
         
         print(f"\n✅ Extraction completed successfully!")
         print(f"📁 Output directory: {self.output_dir}")
         print(f"📄 Structured questions: {structured_json_path}")
         print(f"📄 Complete extraction: {complete_json_path}")
         print(f"🖼️  Images saved in: {self.images_dir}")
-        print(f"📊 Total questions found: {len(structured_content)}")
+        print(f"📊 Total questions found: {len(questions)}")
         
-        return structured_content
+        return questions
     
     def close(self):
         """Close the PDF document."""
         self.doc.close()
 
 
-def main():
-    """Main function to run the PDF content analyzer."""
+# Per-process analyzer used by PDFContentAnalyzer.prefetch_pages workers
+_worker_analyzer: Optional[PDFContentAnalyzer] = None
+
+
+def _init_worker(pdf_path: str, output_dir: str, images_dir: str):
+    """Open the PDF once in each worker process, writing to the parent's directories."""
+    global _worker_analyzer
+    _worker_analyzer = PDFContentAnalyzer(pdf_path, max_workers=1, output_dir=output_dir)
+    _worker_analyzer.images_dir = images_dir
+
+
+def _extract_page(page_num: int) -> Tuple[str, List[str]]:
+    """Extract the text and images of a page inside a worker process."""
+    return _worker_analyzer.extract_page(page_num)
+
+
+def main() -> Optional[List[Question]]:
+    """Main function to run the PDF content analyzer. Returns the extracted questions."""
     # Path to the PDF file (update this path as needed)
     pdf_path = "IMO class 1 Maths Olympiad Sample Paper 1 for the year 2024-25.pdf"
     
@@ -256,15 +502,15 @@ def main():
         # Close the document
         analyzer.close()
         
+        return results
+        
     except FileNotFoundError:
         print(f"❌ Error: PDF file '{pdf_path}' not found.")
         print("Please make sure the PDF file is in the same directory as this script.")
     except Exception as e:
         print(f"❌ Error occurred: {str(e)}")
-
-
-if __name__ == "__main__":
-    main()
+    
+    return None
 
 
 # Additional utility functions for advanced analysis
@@ -320,13 +566,20 @@ class QuestionAnalyzer:
 
 
 # Example usage with the provided sample file
-def analyze_sample_file():
-    """Analyze the provided sample file and generate detailed report."""
+def analyze_sample_file(results: Optional[List[Question]] = None):
+    """
+    Analyze the provided sample file and generate detailed report.
+    
+    Pass the questions returned by main() to report on them without
+    extracting the PDF again.
+    """
     pdf_path = "IMO class 1 Maths Olympiad Sample Paper 1 for the year 2024-25.pdf"
+    analyzer = None
     
     try:
-        analyzer = PDFContentAnalyzer(pdf_path)
-        results = analyzer.save_results()
+        if results is None:
+            analyzer = PDFContentAnalyzer(pdf_path)
+            results = analyzer.save_results()
         
         # Generate additional analysis
         stats = QuestionAnalyzer.generate_statistics(results)
@@ -344,7 +597,8 @@ def analyze_sample_file():
         for answer, count in stats["answer_distribution"].items():
             print(f"  {answer}: {count} questions")
         
-        analyzer.close()
+        if analyzer is not None:
+            analyzer.close()
         
     except Exception as e:
         print(f"Error in analysis: {str(e)}")
@@ -352,8 +606,9 @@ def analyze_sample_file():
 
 if __name__ == "__main__":
     # Run the main analysis
-    main()
+    results = main()
     
-    # Run additional detailed analysis
-    print("\n" + "="*60)
-    analyze_sample_file()
\ No newline at end of file
+    # Run additional detailed analysis on the same results
+    if results is not None:
+        print("\n" + "="*60)
+        analyze_sample_file(results)
\ No newline at end of file